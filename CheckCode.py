@@ -4,34 +4,132 @@
 使用ツール: flake8 (with extensions), pylint
 """
 
-import subprocess
+import ast
+import dbm
+import hashlib
+import io
 import json
 import os
+import shelve
+import sys
+import tokenize
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from importlib.metadata import entry_points
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
-import re
+
+try:
+    from flake8 import __version__ as flake8_version
+    from flake8.api import legacy as flake8_legacy
+    from flake8.formatting.base import BaseFormatter as Flake8BaseFormatter
+except ImportError:
+    flake8_legacy = None
+    flake8_version = None
+
+try:
+    from pylint import __version__ as pylint_version
+    from pylint.config import find_default_config_files
+    from pylint.lint import Run as PylintRun
+    from pylint.reporters import CollectingReporter
+except ImportError:
+    PylintRun = None
+    pylint_version = None
+
+# 結果キャッシュのキーに混ぜる値（解析結果の形式を変えたら _CACHE_FORMAT を上げる）
+# ast やツールの判定はインタプリタのバージョンでも変わるため、それも含める
+_CACHE_FORMAT = 3
+_CACHE_SALT = (f'{_CACHE_FORMAT}:{sys.implementation.name}={sys.version}'
+               f':flake8={flake8_version}:pylint={pylint_version}')
+
+# flake8のエラーコード分類（接頭辞 -> カテゴリ）
+_ERROR_CATEGORIES = {
+    'E': 'PEP 8 errors',
+    'W': 'PEP 8 warnings',
+    'F': 'PyFlakes errors',
+    'C': 'Complexity',
+    'D': 'Docstring issues',
+    'TC': 'Type checking issues',
+    'N': 'Naming conventions'
+}
+
+# コード行の判定に含めないトークン種別
+_NON_CODE_TOKENS = {
+    tokenize.NL,
+    tokenize.NEWLINE,
+    tokenize.INDENT,
+    tokenize.DEDENT,
+    tokenize.ENCODING,
+    tokenize.ENDMARKER,
+}
 
 class CodeQualityChecker:
     """コード品質をチェックするクラス"""
     
-    def __init__(self, code_directory: str):
+    def __init__(self, code_directory: str,
+                 cache_dir: Optional[str] = '~/.cache/codequality'):
         """
         Args:
             code_directory: 検証対象のコードが格納されているディレクトリ
+            cache_dir: 結果キャッシュの保存先（None でキャッシュを無効化）
         """
         self.code_dir = Path(code_directory)
+        self.cache_dir = Path(cache_dir).expanduser() if cache_dir is not None else None
         self.results = {}
         
         # flake8のエラーコード分類
-        self.error_categories = {
-            'E': 'PEP 8 errors',
-            'W': 'PEP 8 warnings', 
-            'F': 'PyFlakes errors',
-            'C': 'Complexity',
-            'D': 'Docstring issues',
-            'TC': 'Type checking issues',
-            'N': 'Naming conventions'
-        }
+        self.error_categories = _ERROR_CATEGORIES
+        
+        # flake8・pylintはプロセス内で呼び出し、起動とプラグイン読み込みのコストを1回にまとめる
+        self._flake8_violations = []
+        self._flake8_guide = self._create_flake8_guide() if flake8_legacy is not None else None
+        
+        # 解析結果はファイルの場所やプラグイン・設定にも依存するため、それらもキャッシュキーに含める
+        self._cache_salt = self._create_cache_salt() if self.cache_dir is not None else None
+    
+    def _create_flake8_guide(self):
+        """違反を self._flake8_violations に集めるflake8のStyleGuideを作成"""
+        violations = self._flake8_violations
+        
+        class CollectingFormatter(Flake8BaseFormatter):
+            """違反を標準出力に書き出さずリストへ集めるフォーマッタ"""
+            
+            def handle(self, error):
+                violations.append(error)
+        
+        guide = flake8_legacy.get_style_guide(max_line_length=88)  # Blackスタイルの行長
+        guide.init_report(CollectingFormatter)
+        return guide
+    
+    def _create_cache_salt(self) -> str:
+        """キャッシュキーに混ぜる値を作成（ツール・flake8プラグインのバージョンと設定）"""
+        parts = [_CACHE_SALT]
+        
+        # flake8-docstrings などのプラグインは入れるだけで結果が変わる
+        parts.extend(sorted({
+            f'{entry_point.dist.name}={entry_point.dist.version}'
+            for group in ('flake8.extension', 'flake8.report')
+            for entry_point in entry_points(group=group)
+            if entry_point.dist is not None
+        }))
+        
+        # flake8の設定ファイル（setup.cfg, tox.ini, .flake8）を反映済みのオプション
+        if self._flake8_guide is not None:
+            options = vars(self._flake8_guide.options)
+            parts.append(repr(sorted(
+                (name, value) for name, value in options.items() if name != 'filenames'
+            )))
+        
+        # pylintの設定ファイルの内容（load-plugins などもここで指定される）
+        if PylintRun is not None:
+            for config_file in find_default_config_files():
+                try:
+                    config_digest = hashlib.blake2b(Path(config_file).read_bytes()).hexdigest()
+                except OSError:
+                    config_digest = None
+                parts.append(f'{config_file}={config_digest}')
+        
+        return '\n'.join(parts)
     
     def check_flake8_with_extensions(self, filepath: str) -> Dict:
         """
@@ -39,126 +137,74 @@ class CodeQualityChecker:
         - flake8-docstrings: docstringのチェック
         - flake8-type-checking: 型チェック関連
         """
+        if self._flake8_guide is None:
+            return {
+                'tool': 'flake8',
+                'error': 'flake8 not installed. Please run: pip install flake8 flake8-docstrings flake8-type-checking'
+            }
+        
         try:
             # flake8を実行（拡張機能は自動的に有効になる）
-            result = subprocess.run(
-                [
-                    'flake8',
-                    '--statistics',
-                    '--count',
-                    '--show-source',  # エラー箇所のソースコードを表示
-                    '--max-line-length=88',  # Blackスタイルの行長
-                    filepath
-                ],
-                capture_output=True,
-                text=True
-            )
+            self._flake8_violations.clear()
+            self._flake8_guide.check_files([filepath])
             
             # 結果の解析
             issues = []
-            statistics = {}
+            statistics = Counter()
             total_errors = 0
-            errors_by_category = {}
-            
-            # 各行を解析
-            lines = result.stdout.split('\n')
-            for line in lines:
-                if not line.strip():
-                    continue
+            errors_by_category = Counter()
+            
+            for violation in self._flake8_violations:
+                error_code = violation.code
+                category = self._categorize_error(error_code)
+                issues.append({
+                    'line': violation.line_number,
+                    'column': violation.column_number,
+                    'code': error_code,
+                    'message': violation.text,
+                    'category': category
+                })
+                total_errors += 1
+                statistics[error_code] += 1
                 
-                # ファイル名:行:列: エラーコード メッセージ の形式を解析
-                match = re.match(r'.*:(\d+):(\d+):\s+([A-Z]+\d+)\s+(.*)', line)
-                if match:
-                    line_num, col_num, error_code, message = match.groups()
-                    issues.append({
-                        'line': int(line_num),
-                        'column': int(col_num),
-                        'code': error_code,
-                        'message': message,
-                        'category': self._categorize_error(error_code)
-                    })
-                    total_errors += 1
-                    
-                    # カテゴリ別にカウント
-                    category = self._categorize_error(error_code)
-                    errors_by_category[category] = errors_by_category.get(category, 0) + 1
-            
-            # 統計情報の解析（標準エラー出力から）
-            stderr_lines = result.stderr.split('\n')
-            for line in stderr_lines:
-                parts = line.strip().split()
-                if len(parts) >= 2 and parts[0].isdigit():
-                    count = int(parts[0])
-                    code = parts[1]
-                    statistics[code] = count
+                # カテゴリ別にカウント
+                errors_by_category[category] += 1
             
             return {
                 'tool': 'flake8',
                 'total_issues': total_errors,
                 'issues': issues[:10],  # 最初の10件のみ詳細を保存
-                'errors_by_category': errors_by_category,
-                'statistics': statistics,
+                'errors_by_category': dict(errors_by_category),
+                'statistics': dict(statistics),
                 'has_docstring_issues': 'Docstring issues' in errors_by_category,
                 'has_type_checking_issues': 'Type checking issues' in errors_by_category,
-                'exit_code': result.returncode
+                'exit_code': 1 if total_errors else 0  # flake8コマンドの終了コード相当
             }
             
-        except FileNotFoundError:
-            return {
-                'tool': 'flake8',
-                'error': 'flake8 not installed. Please run: pip install flake8 flake8-docstrings flake8-type-checking'
-            }
         except Exception as e:
             return {'tool': 'flake8', 'error': str(e)}
     
     def _categorize_error(self, error_code: str) -> str:
-        """エラーコードをカテゴリに分類"""
-        if error_code.startswith('E'):
-            return 'PEP 8 errors'
-        elif error_code.startswith('W'):
-            return 'PEP 8 warnings'
-        elif error_code.startswith('F'):
-            return 'PyFlakes errors'
-        elif error_code.startswith('C'):
-            return 'Complexity'
-        elif error_code.startswith('D'):
-            return 'Docstring issues'
-        elif error_code.startswith('TC'):
-            return 'Type checking issues'
-        elif error_code.startswith('N'):
-            return 'Naming conventions'
-        else:
-            return 'Other'
+        """エラーコードをカテゴリに分類（2文字の接頭辞 'TC' を先に調べる）"""
+        return _ERROR_CATEGORIES.get(error_code[:2]) or _ERROR_CATEGORIES.get(error_code[:1], 'Other')
     
     def check_pylint(self, filepath: str) -> Dict:
         """pylintでチェック（詳細な解析）"""
+        if PylintRun is None:
+            return {
+                'tool': 'pylint',
+                'error': 'pylint not installed. Please run: pip install pylint'
+            }
+        
         try:
-            result = subprocess.run(
-                [
-                    'pylint',
-                    '--output-format=json',  # JSON形式で出力
-                    filepath
-                ],
-                capture_output=True,
-                text=True
-            )
-            
-            # スコアを取得するために通常形式でも実行
-            score_result = subprocess.run(
-                ['pylint', '--score=y', filepath],
-                capture_output=True,
-                text=True
-            )
-            
-            # スコアを抽出
-            score = None
-            for line in score_result.stdout.split('\n'):
-                if 'Your code has been rated at' in line:
-                    score_match = re.search(r'([-\d.]+)/10', line)
-                    if score_match:
-                        score = float(score_match.group(1))
-            
-            # JSON結果を解析
+            # 1回の実行でメッセージを直接収集し、スコアはリンターの統計から取得する
+            reporter = CollectingReporter()
+            run = PylintRun([filepath], reporter=reporter, exit=False)
+            stats = run.linter.stats
+            # pylintは下限を max(0, ...) で丸めるため int の 0 になることがあり、float に揃える
+            score = float(round(stats.global_note, 2)) if stats.statement else None
+            
+            # メッセージを集計
             issues_by_type = {
                 'convention': 0,
                 'refactor': 0,
@@ -168,48 +214,47 @@ class CodeQualityChecker:
                 'info': 0
             }
             
-            message_types = {}
+            message_types = Counter()
             
-            try:
-                issues = json.loads(result.stdout) if result.stdout else []
-                for issue in issues:
-                    issue_type = issue.get('type', 'unknown')
-                    if issue_type in issues_by_type:
-                        issues_by_type[issue_type] += 1
-                    
-                    # メッセージIDごとにカウント
-                    msg_id = issue.get('message-id', 'unknown')
-                    message_types[msg_id] = message_types.get(msg_id, 0) + 1
-            except json.JSONDecodeError:
-                issues = []
+            for message in reporter.messages:
+                if message.category in issues_by_type:
+                    issues_by_type[message.category] += 1
+                
+                # メッセージIDごとにカウント
+                message_types[message.msg_id] += 1
             
             return {
                 'tool': 'pylint',
                 'score': score,
                 'issues_by_type': issues_by_type,
                 'total_issues': sum(issues_by_type.values()),
-                'message_types': dict(sorted(message_types.items(), key=lambda x: x[1], reverse=True)[:10]),  # 上位10件
+                'message_types': dict(message_types.most_common(10)),  # 上位10件
                 'has_errors': issues_by_type.get('error', 0) > 0,
                 'has_warnings': issues_by_type.get('warning', 0) > 0
             }
             
-        except FileNotFoundError:
-            return {
-                'tool': 'pylint',
-                'error': 'pylint not installed. Please run: pip install pylint'
-            }
         except Exception as e:
             return {'tool': 'pylint', 'error': str(e)}
     
     def analyze_code_structure(self, filepath: str) -> Dict:
         """コード構造の分析（型ヒント、docstring、etc）"""
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                content = f.read()
-                lines = content.split('\n')
+            # 一括で読み込んでからデコードする（行単位のバッファリングを挟まない）
+            # BOMやPEP 263のエンコーディング宣言はインタプリタと同じ規則で判定する
+            source = Path(filepath).read_bytes()
+            encoding, _ = tokenize.detect_encoding(io.BytesIO(source).readline)
+            content = source.decode(encoding)
+            
+            # 構文エラーのファイルも行数の集計は行い、構文木から得る値だけを空にする
+            try:
+                tree = ast.parse(content, filename=filepath)
+                syntax_error = None
+            except SyntaxError as e:
+                tree = None
+                syntax_error = str(e)
             
             analysis = {
-                'total_lines': len(lines),
+                'total_lines': 0,
                 'code_lines': 0,
                 'comment_lines': 0,
                 'docstring_lines': 0,
@@ -221,80 +266,87 @@ class CodeQualityChecker:
                 'imports_count': 0,
                 'type_annotations_count': 0
             }
+            if syntax_error is not None:
+                analysis['syntax_error'] = syntax_error
+            
+            # 構文木から関数・クラス・import・型アノテーション・docstringの行範囲を収集
+            # （構文エラーのときはモジュールのdocstringだけをトークン列から探す）
+            if tree is not None:
+                analysis['has_module_docstring'] = ast.get_docstring(tree) is not None
+                docstring_rows = set()
+                nodes = ast.walk(tree)
+            else:
+                docstring_rows = self._module_docstring_rows(content)
+                analysis['has_module_docstring'] = bool(docstring_rows)
+                nodes = ()
+            for node in nodes:
+                if isinstance(node, (ast.Module, ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+                    if ast.get_docstring(node, clean=False) is not None:
+                        docstring = node.body[0]
+                        docstring_rows.update(range(docstring.lineno, docstring.end_lineno + 1))
+                
+                if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    args = node.args
+                    annotations = [arg.annotation for arg in args.posonlyargs + args.args + args.kwonlyargs]
+                    annotations += [arg.annotation for arg in (args.vararg, args.kwarg) if arg is not None]
+                    annotations.append(node.returns)
+                    annotated = sum(1 for annotation in annotations if annotation is not None)
+                    analysis['functions'].append({
+                        'name': node.name,
+                        'line': node.lineno,
+                        'has_type_hints': annotated > 0
+                    })
+                    analysis['type_annotations_count'] += annotated
+                elif isinstance(node, ast.ClassDef):
+                    analysis['classes'].append({
+                        'name': node.name,
+                        'line': node.lineno
+                    })
+                elif isinstance(node, ast.AnnAssign):
+                    analysis['type_annotations_count'] += 1
+                elif isinstance(node, (ast.Import, ast.ImportFrom)):
+                    analysis['imports_count'] += 1
             
-            # モジュールレベルのdocstringチェック
-            stripped_content = content.strip()
-            if stripped_content.startswith('"""') or stripped_content.startswith("'''"):
-                analysis['has_module_docstring'] = True
+            # ast.walk は幅優先なので行番号順に並べ直す
+            analysis['functions'].sort(key=lambda item: item['line'])
+            analysis['classes'].sort(key=lambda item: item['line'])
+            analysis['has_type_hints'] = analysis['type_annotations_count'] > 0
             
-            in_docstring = False
-            docstring_quotes = None
+            # トークン列からコード行・コメント行を判定（複数行の文字列は全行をコード行とする）
+            # （行数の多いファイルで支配的になるため、属性参照を避けてローカル変数で数える）
+            code_rows = set()
+            comment_rows = set()
+            try:
+                for token_type, _, (start_row, _), (end_row, _), _ in tokenize.generate_tokens(io.StringIO(content).readline):
+                    if token_type == tokenize.COMMENT:
+                        comment_rows.add(start_row)
+                    elif token_type in _NON_CODE_TOKENS:
+                        continue
+                    elif start_row == end_row:
+                        code_rows.add(start_row)
+                    else:
+                        code_rows.update(range(start_row, end_row + 1))
+            except (tokenize.TokenError, SyntaxError):
+                # 構文エラーのファイルでは途中までのトークンで判定し、残りはコード行とする
+                pass
+            
+            # 行のリストは作らず、1行ずつ読みながら総行数も数える
+            row = blank_lines = docstring_lines = comment_lines = code_lines = 0
+            for row, line in enumerate(io.StringIO(content), start=1):
+                if not line or line.isspace():
+                    blank_lines += 1
+                elif row in docstring_rows:
+                    docstring_lines += 1
+                elif row in comment_rows and row not in code_rows:
+                    comment_lines += 1
+                else:
+                    code_lines += 1
             
-            for i, line in enumerate(lines):
-                stripped = line.strip()
-                
-                # 空行の判定を修正：実際に空白のみの行かチェック
-                if not stripped:
-                    analysis['blank_lines'] += 1
-                    continue
-                
-                # docstring処理
-                if '"""' in stripped or "'''" in stripped:
-                    quotes = '"""' if '"""' in stripped else "'''"
-                    if not in_docstring:
-                        in_docstring = True
-                        docstring_quotes = quotes
-                        analysis['docstring_lines'] += 1
-                    elif quotes == docstring_quotes:
-                        in_docstring = False
-                        analysis['docstring_lines'] += 1
-                    continue
-                
-                if in_docstring:
-                    analysis['docstring_lines'] += 1
-                    continue
-                
-                # コメント行の判定を修正
-                if stripped.startswith('#'):
-                    analysis['comment_lines'] += 1
-                    continue
-                
-                # ここまで来たらコード行
-                analysis['code_lines'] += 1
-                
-                # import文
-                if stripped.startswith('import ') or stripped.startswith('from '):
-                    analysis['imports_count'] += 1
-                
-                # 関数定義（型ヒント付きかチェック）
-                if stripped.startswith('def '):
-                    func_match = re.match(r'def\s+(\w+)\s*\((.*?)\)', stripped)
-                    if func_match:
-                        func_name = func_match.group(1)
-                        params = func_match.group(2)
-                        has_type_hint = '->' in line or ':' in params
-                        analysis['functions'].append({
-                            'name': func_name,
-                            'line': i + 1,
-                            'has_type_hints': has_type_hint
-                        })
-                        if has_type_hint:
-                            analysis['has_type_hints'] = True
-                            analysis['type_annotations_count'] += 1
-                
-                # クラス定義
-                if stripped.startswith('class '):
-                    class_match = re.match(r'class\s+(\w+)', stripped)
-                    if class_match:
-                        analysis['classes'].append({
-                            'name': class_match.group(1),
-                            'line': i + 1
-                        })
-                
-                # 変数の型アノテーション
-                if re.search(r':\s*(int|str|float|bool|List|Dict|Tuple|Optional|Any|Union)', line):
-                    analysis['type_annotations_count'] += 1
-                    analysis['has_type_hints'] = True
+            analysis['total_lines'] = row
+            analysis['blank_lines'] = blank_lines
+            analysis['docstring_lines'] = docstring_lines
+            analysis['comment_lines'] = comment_lines
+            analysis['code_lines'] = code_lines
             
             # 比率計算
             if analysis['total_lines'] > 0:
@@ -309,9 +361,69 @@ class CodeQualityChecker:
         except Exception as e:
             return {'error': str(e)}
     
-    def check_file(self, filepath: str) -> Dict:
-        """単一ファイルの完全チェック"""
-        full_path = self.code_dir / filepath if not Path(filepath).is_absolute() else Path(filepath)
+    @staticmethod
+    def _module_docstring_rows(content: str) -> set:
+        """構文木を作れないファイルで、先頭の文字列だけの文をモジュールのdocstringとみなしその行を返す"""
+        skipped = (tokenize.ENCODING, tokenize.NL, tokenize.COMMENT)
+        try:
+            tokens = (
+                token for token in tokenize.generate_tokens(io.StringIO(content).readline)
+                if token.type not in skipped
+            )
+            first = next(tokens, None)
+            if first is None or first.type != tokenize.STRING:
+                return set()
+            following = next(tokens, None)
+            if following is not None and following.type not in (tokenize.NEWLINE, tokenize.ENDMARKER):
+                return set()
+        except (tokenize.TokenError, SyntaxError):
+            return set()
+        return set(range(first.start[0], first.end[0] + 1))
+    
+    def _resolve_path(self, filepath: str) -> Path:
+        """code_dir からの相対パスを解決（絶対パスはそのまま）"""
+        return self.code_dir / filepath if not Path(filepath).is_absolute() else Path(filepath)
+    
+    def _cache_key(self, full_path: Path) -> Optional[str]:
+        """
+        ファイルの場所・内容とツールのバージョン・設定からキャッシュキーを作成
+        （ファイルが読めなければ None とし、エラーは _run_checks でファイルごとに報告する）
+        
+        pylintのモジュール名のチェック（C0103）などファイル名で結果が変わるため、
+        内容が同じでも場所の異なるファイルは別のエントリとする
+        """
+        try:
+            digest = hashlib.blake2b(full_path.read_bytes())
+        except OSError:
+            return None
+        digest.update(str(full_path.resolve()).encode())
+        digest.update(self._cache_salt.encode())
+        return digest.hexdigest()
+    
+    def _open_cache(self) -> Optional[shelve.Shelf]:
+        """結果キャッシュを開く（キャッシュ無効時は None）"""
+        if self.cache_dir is None:
+            return None
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            return shelve.open(str(self.cache_dir / 'results'))
+        except (OSError, dbm.error[0]) as e:
+            # 開けない場合は以降キャッシュなしで続行（警告は一度だけ）
+            print(f"Warning: result cache disabled ({e})")
+            self.cache_dir = None
+            return None
+    
+    @staticmethod
+    def _is_cacheable(result: Dict) -> bool:
+        """どのツールもエラーを返していない結果だけをキャッシュ対象とする"""
+        return all(
+            'error' not in result.get(tool, {'error': None})
+            for tool in ('flake8', 'pylint', 'structure')
+        )
+    
+    def _run_checks(self, filepath: str) -> Dict:
+        """キャッシュを使わずに単一ファイルをチェック"""
+        full_path = self._resolve_path(filepath)
         
         if not full_path.exists():
             return {'error': f'File not found: {filepath}'}
@@ -323,21 +435,98 @@ class CodeQualityChecker:
             'structure': self.analyze_code_structure(str(full_path))
         }
     
-    def check_all_files(self, language_patterns: Dict[str, List[str]]) -> Dict:
+    def check_file(self, filepath: str) -> Dict:
+        """
+        単一ファイルの完全チェック
+        
+        結果はファイルの場所・内容とツールのバージョン・設定をキーにディスクへ
+        キャッシュし、どれも変わっていなければ再解析しない
+        """
+        full_path = self._resolve_path(filepath)
+        cache = self._open_cache() if full_path.exists() else None
+        if cache is None:
+            return self._run_checks(filepath)
+        
+        with cache:
+            key = self._cache_key(full_path)
+            if key is None:
+                return self._run_checks(filepath)
+            if key in cache:
+                return {'filename': filepath, **cache[key]}
+            
+            result = self._run_checks(filepath)
+            if self._is_cacheable(result):
+                cache[key] = {k: v for k, v in result.items() if k != 'filename'}
+            return result
+    
+    def check_all_files(self, language_patterns: Dict[str, List[str]],
+                        max_workers: Optional[int] = None) -> Dict:
         """
         言語パターン別にすべてのファイルをチェック
         
+        キャッシュ済みのファイルはその結果を使い、残りのファイルは互いに独立して
+        いるためプロセスプールで並列に解析する。キャッシュの読み書きは競合を避ける
+        ため親プロセスだけで行う
+        
         Args:
             language_patterns: {'en': ['file1.py', ...], 'ja': [...], 'mixed': [...]}
+            max_workers: ワーカープロセス数（省略時はCPU数と未キャッシュのファイル数の小さい方）
         """
-        results = {}
+        results = {lang: [None] * len(files) for lang, files in language_patterns.items()}
+        cache = self._open_cache()
         
-        for lang, files in language_patterns.items():
-            results[lang] = []
-            for filepath in files:
+        try:
+            tasks = [
+                (lang, index, filepath)
+                for lang, files in language_patterns.items()
+                for index, filepath in enumerate(files)
+            ]
+            
+            # キャッシュキーの計算はファイルの読み込みが大半なので、スレッドで並行して読む
+            if cache is not None:
+                with ThreadPoolExecutor() as reader:
+                    keys = list(reader.map(
+                        self._cache_key,
+                        [self._resolve_path(filepath) for _, _, filepath in tasks]
+                    ))
+            else:
+                keys = [None] * len(tasks)
+            
+            # キャッシュに無いファイルだけを (言語, 位置, ファイル, キャッシュキー) として集める
+            pending = []
+            for (lang, index, filepath), key in zip(tasks, keys):
                 print(f"Checking {lang}/{filepath}...")
-                file_result = self.check_file(filepath)
-                results[lang].append(file_result)
+                if key is not None and key in cache:
+                    results[lang][index] = {'filename': filepath, **cache[key]}
+                else:
+                    pending.append((lang, index, filepath, key))
+            
+            if not pending:
+                return results
+            
+            if max_workers is None:
+                max_workers = min(len(pending), os.cpu_count() or 1)
+            
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_worker,
+                initargs=(str(self.code_dir),)
+            ) as executor:
+                futures = {
+                    executor.submit(_check_file_in_worker, filepath): (lang, index, key)
+                    for lang, index, filepath, key in pending
+                }
+                
+                # 完了順に受け取り、入力と同じ順序の位置に格納
+                for future in as_completed(futures):
+                    lang, index, key = futures[future]
+                    result = future.result()
+                    results[lang][index] = result
+                    if key is not None and self._is_cacheable(result):
+                        cache[key] = {k: v for k, v in result.items() if k != 'filename'}
+        finally:
+            if cache is not None:
+                cache.close()
         
         return results
     
@@ -358,7 +547,7 @@ class CodeQualityChecker:
             # 言語別の集計
             lang_summary = {
                 'flake8_total': 0,
-                'flake8_categories': {},
+                'flake8_categories': Counter(),
                 'pylint_scores': [],
                 'pylint_issues': 0,
                 'has_docstrings': 0,
@@ -373,9 +562,7 @@ class CodeQualityChecker:
                     lang_summary['flake8_total'] += file_result['flake8']['total_issues']
                     
                     # カテゴリ別集計
-                    for category, count in file_result['flake8'].get('errors_by_category', {}).items():
-                        lang_summary['flake8_categories'][category] = \
-                            lang_summary['flake8_categories'].get(category, 0) + count
+                    lang_summary['flake8_categories'].update(file_result['flake8'].get('errors_by_category', {}))
                 
                 # pylint結果の集計
                 if 'pylint' in file_result:
@@ -395,8 +582,9 @@ class CodeQualityChecker:
                     lang_summary['avg_comment_ratio'] += structure.get('comment_ratio', 0)
             
             # 平均値計算
-            if lang_summary['files_count'] > 0:
-                lang_summary['avg_comment_ratio'] /= lang_summary['files_count']
+            files_count = lang_summary['files_count']
+            if files_count > 0:
+                lang_summary['avg_comment_ratio'] /= files_count
                 if lang_summary['pylint_scores']:
                     lang_summary['avg_pylint_score'] = sum(lang_summary['pylint_scores']) / len(lang_summary['pylint_scores'])
                 else:
@@ -404,7 +592,7 @@ class CodeQualityChecker:
             
             # レポート出力
             report.append(f"\n📊 Summary for {lang.upper()}:")
-            report.append(f"  Files analyzed: {lang_summary['files_count']}")
+            report.append(f"  Files analyzed: {files_count}")
             
             report.append(f"\n  Flake8 Results:")
             report.append(f"    Total issues: {lang_summary['flake8_total']}")
@@ -418,8 +606,8 @@ class CodeQualityChecker:
             report.append(f"    Total issues: {lang_summary['pylint_issues']}")
             
             report.append(f"\n  Code Quality Metrics:")
-            report.append(f"    Files with module docstrings: {lang_summary['has_docstrings']}/{lang_summary['files_count']}")
-            report.append(f"    Files with type hints: {lang_summary['has_type_hints']}/{lang_summary['files_count']}")
+            report.append(f"    Files with module docstrings: {lang_summary['has_docstrings']}/{files_count}")
+            report.append(f"    Files with type hints: {lang_summary['has_type_hints']}/{files_count}")
             report.append(f"    Average comment ratio: {lang_summary['avg_comment_ratio']:.1%}")
             
             summary_data[lang] = lang_summary
@@ -440,30 +628,55 @@ class CodeQualityChecker:
             
             # 詳細な比較
             report.append(f"\n📈 Detailed Comparison:")
-            langs = list(summary_data.keys())
+            
+            # 言語ごとの1ファイルあたりの指標を一度だけ計算
+            # (flake8の問題数, module docstring率, 型ヒント率)
+            per_file = {}
+            for lang, summary in summary_data.items():
+                files_count = summary['files_count']
+                if files_count > 0:
+                    per_file[lang] = (
+                        summary['flake8_total'] / files_count,
+                        summary['has_docstrings'] / files_count,
+                        summary['has_type_hints'] / files_count
+                    )
+                else:
+                    per_file[lang] = (0, 0, 0)
             
             # PEP 8準拠度の比較
             report.append(f"\n  PEP 8 Compliance (flake8 issues - lower is better):")
-            for lang in langs:
-                issues_per_file = summary_data[lang]['flake8_total'] / summary_data[lang]['files_count'] if summary_data[lang]['files_count'] > 0 else 0
+            for lang, (issues_per_file, _, _) in per_file.items():
                 report.append(f"    {lang}: {issues_per_file:.1f} issues/file")
             
             # Docstring使用率の比較
             report.append(f"\n  Documentation Quality:")
-            for lang in langs:
-                doc_ratio = summary_data[lang]['has_docstrings'] / summary_data[lang]['files_count'] if summary_data[lang]['files_count'] > 0 else 0
+            for lang, (_, doc_ratio, _) in per_file.items():
                 report.append(f"    {lang}: {doc_ratio:.0%} files with module docstrings")
             
             # 型ヒント使用率の比較
             report.append(f"\n  Type Safety:")
-            for lang in langs:
-                type_ratio = summary_data[lang]['has_type_hints'] / summary_data[lang]['files_count'] if summary_data[lang]['files_count'] > 0 else 0
+            for lang, (_, _, type_ratio) in per_file.items():
                 report.append(f"    {lang}: {type_ratio:.0%} files with type hints")
         
         report.append("\n" + "=" * 70)
         return "\n".join(report)
 
 
+# ワーカープロセスごとに1つだけ生成するチェッカー（flake8・pylintの読み込みをファイル間で使い回す）
+_worker_checker: Optional[CodeQualityChecker] = None
+
+
+def _init_worker(code_directory: str) -> None:
+    """ワーカープロセスの初期化"""
+    global _worker_checker
+    _worker_checker = CodeQualityChecker(code_directory, cache_dir=None)
+
+
+def _check_file_in_worker(filepath: str) -> Dict:
+    """ワーカープロセス内で単一ファイルをチェック"""
+    return _worker_checker.check_file(filepath)
+
+
 # 使用例
 if __name__ == "__main__":
     import sys
@@ -16,8 +16,11 @@ class TreeNode:
         data: The value stored in the node.
         left: Reference to the left child node.
         right: Reference to the right child node.
+        height: Height of the subtree rooted at this node (1 for a leaf).
     """
 
+    __slots__ = ('data', 'left', 'right', 'height')
+
     def __init__(self, data: Any) -> None:
         """
         Initialize a tree node.
@@ -28,6 +31,7 @@ class TreeNode:
         self.data = data
         self.left: Optional['TreeNode'] = None
         self.right: Optional['TreeNode'] = None
+        self.height = 1
 
 
 class BinarySearchTree:
@@ -42,6 +46,9 @@ class BinarySearchTree:
     def __init__(self) -> None:
         """Initialize an empty binary search tree."""
         self.root: Optional[TreeNode] = None
+        # Node holding the smallest value, kept up to date by insert and delete.
+        self._min_node: Optional[TreeNode] = None
+        self._size = 0
 
     def insert(self, data: Any) -> None:
         """
@@ -58,32 +65,34 @@ class BinarySearchTree:
 
         if self.root is None:
             self.root = TreeNode(data)
-        else:
-            self._insert_recursive(self.root, data)
-
-    def _insert_recursive(self, node: TreeNode, data: Any) -> TreeNode:
-        """
-        Recursively insert a value into the tree.
-
-        Args:
-            node: The current node being examined.
-            data: The value to insert.
-
-        Returns:
-            The node after insertion.
-        """
-        if data < node.data:
-            if node.left is None:
-                node.left = TreeNode(data)
-            else:
-                self._insert_recursive(node.left, data)
-        elif data > node.data:
-            if node.right is None:
-                node.right = TreeNode(data)
+            self._min_node = self.root
+            self._size = 1
+            return
+
+        # Remember the descent so cached heights can be fixed on the way back up.
+        path: List[TreeNode] = []
+        node = self.root
+        while True:
+            path.append(node)
+            if data < node.data:
+                if node.left is None:
+                    node.left = TreeNode(data)
+                    # The minimum has no left child, so a new left child of it
+                    # is the new minimum.
+                    if node is self._min_node:
+                        self._min_node = node.left
+                    break
+                node = node.left
+            elif data > node.data:
+                if node.right is None:
+                    node.right = TreeNode(data)
+                    break
+                node = node.right
             else:
-                self._insert_recursive(node.right, data)
+                return
 
-        return node
+        self._size += 1
+        self._update_heights(path)
 
     def search(self, data: Any) -> bool:
         """
@@ -101,28 +110,12 @@ class BinarySearchTree:
         if data is None:
             raise TypeError("Cannot search for None value")
 
-        return self._search_recursive(self.root, data)
-
-    def _search_recursive(self, node: Optional[TreeNode], data: Any) -> bool:
-        """
-        Recursively search for a value in the tree.
-
-        Args:
-            node: The current node being examined.
-            data: The value to search for.
-
-        Returns:
-            True if the value is found, False otherwise.
-        """
-        if node is None:
-            return False
-
-        if data == node.data:
-            return True
-        elif data < node.data:
-            return self._search_recursive(node.left, data)
-        else:
-            return self._search_recursive(node.right, data)
+        node = self.root
+        while node is not None:
+            if data == node.data:
+                return True
+            node = node.left if data < node.data else node.right
+        return False
 
     def delete(self, data: Any) -> None:
         """
@@ -141,40 +134,67 @@ class BinarySearchTree:
         if self.root is None:
             raise ValueError("Cannot delete from empty tree")
 
-        if not self.search(data):
+        # Find the node in a single descent, remembering the path to it.
+        path: List[TreeNode] = []
+        node: Optional[TreeNode] = self.root
+        while node is not None and data != node.data:
+            path.append(node)
+            node = node.left if data < node.data else node.right
+
+        if node is None:
             raise ValueError(f"Value {data} not found in tree")
 
-        self.root = self._delete_recursive(self.root, data)
+        self._size -= 1
+
+        if node.left is not None and node.right is not None:
+            # Replace the value with the in-order successor, then unlink the successor.
+            path.append(node)
+            successor = node.right
+            while successor.left is not None:
+                path.append(successor)
+                successor = successor.left
+            node.data = successor.data
+            successor_parent = path[-1]
+            if successor_parent is node:
+                successor_parent.right = successor.right
+            else:
+                successor_parent.left = successor.right
+            self._update_heights(path)
+            return
+
+        parent = path[-1] if path else None
+        child = node.left if node.left is not None else node.right
+        if parent is None:
+            self.root = child
+        elif parent.left is node:
+            parent.left = child
+        else:
+            parent.right = child
 
-    def _delete_recursive(self, node: Optional[TreeNode], data: Any) -> Optional[TreeNode]:
-        """
-        Recursively delete a value from the tree.
+        if node is self._min_node:
+            # The old minimum had no left child, so the next smallest value is
+            # the leftmost node of its right subtree, or else its parent.
+            self._min_node = self._find_min_node(child) if child is not None else parent
 
-        Args:
-            node: The current node being examined.
-            data: The value to delete.
+        self._update_heights(path)
 
-        Returns:
-            The node after deletion.
+    def _update_heights(self, path: List[TreeNode]) -> None:
         """
-        if node is None:
-            return None
+        Recompute cached subtree heights along a root-to-node path.
 
-        if data < node.data:
-            node.left = self._delete_recursive(node.left, data)
-        elif data > node.data:
-            node.right = self._delete_recursive(node.right, data)
-        else:
-            if node.left is None:
-                return node.right
-            elif node.right is None:
-                return node.left
-            else:
-                successor = self._find_min_node(node.right)
-                node.data = successor.data
-                node.right = self._delete_recursive(node.right, successor.data)
+        Heights are fixed bottom-up, stopping at the first node whose height
+        is unchanged, since none of its ancestors can change either.
 
-        return node
+        Args:
+            path: The nodes from the root down to the parent of the changed link.
+        """
+        for node in reversed(path):
+            left_height = node.left.height if node.left is not None else 0
+            right_height = node.right.height if node.right is not None else 0
+            height = 1 + max(left_height, right_height)
+            if height == node.height:
+                break
+            node.height = height
 
     def find_min(self) -> Any:
         """
@@ -189,7 +209,7 @@ class BinarySearchTree:
         if self.root is None:
             raise ValueError("Cannot find minimum in empty tree")
 
-        return self._find_min_node(self.root).data
+        return self._min_node.data
 
     def _find_min_node(self, node: TreeNode) -> TreeNode:
         """
@@ -241,22 +261,7 @@ class BinarySearchTree:
         Returns:
             A list containing all values in the tree in sorted order.
         """
-        result: List[Any] = []
-        self._in_order_recursive(self.root, result)
-        return result
-
-    def _in_order_recursive(self, node: Optional[TreeNode], result: List[Any]) -> None:
-        """
-        Recursively perform in-order traversal.
-
-        Args:
-            node: The current node being visited.
-            result: The list to store traversal results.
-        """
-        if node is not None:
-            self._in_order_recursive(node.left, result)
-            result.append(node.data)
-            self._in_order_recursive(node.right, result)
+        return list(self)
 
     def is_empty(self) -> bool:
         """
@@ -274,21 +279,7 @@ class BinarySearchTree:
         Returns:
             The number of nodes in the tree.
         """
-        return self._size_recursive(self.root)
-
-    def _size_recursive(self, node: Optional[TreeNode]) -> int:
-        """
-        Recursively calculate the size of the tree.
-
-        Args:
-            node: The current node being examined.
-
-        Returns:
-            The number of nodes in the subtree rooted at the given node.
-        """
-        if node is None:
-            return 0
-        return 1 + self._size_recursive(node.left) + self._size_recursive(node.right)
+        return self._size
 
     def height(self) -> int:
         """
@@ -297,23 +288,7 @@ class BinarySearchTree:
         Returns:
             The height of the tree (0 for empty tree, 1 for single node).
         """
-        return self._height_recursive(self.root)
-
-    def _height_recursive(self, node: Optional[TreeNode]) -> int:
-        """
-        Recursively calculate the height of the tree.
-
-        Args:
-            node: The current node being examined.
-
-        Returns:
-            The height of the subtree rooted at the given node.
-        """
-        if node is None:
-            return 0
-        left_height = self._height_recursive(node.left)
-        right_height = self._height_recursive(node.right)
-        return 1 + max(left_height, right_height)
+        return 0 if self.root is None else self.root.height
 
     def __str__(self) -> str:
         """
@@ -335,6 +310,26 @@ class BinarySearchTree:
         """
         return self.size()
 
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Iterate over the values in the tree in sorted order.
+
+        Values are produced lazily, so only the path to the current node is
+        kept in memory.
+
+        Yields:
+            Each value in the tree in ascending order.
+        """
+        stack: List[TreeNode] = []
+        node = self.root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.data
+            node = node.right
+
     def __contains__(self, data: Any) -> bool:
         """
         Check if a value exists in the tree using 'in' operator.
@@ -5,7 +5,12 @@ This module provides a complete Binary Search Tree (BST) implementation
 with insert, search, delete, traversal, and utility methods.
 """
 
-from typing import Optional, List, Any, Union
+from typing import Optional, List, Any, Callable, Dict, Iterable, Iterator, Tuple, Union
+
+
+# Deepest tree level compile_search will unroll. Each unrolled level nests the
+# generated code one indent deeper, and the tokenizer allows at most 100 levels.
+_MAX_COMPILED_DEPTH = 90
 
 
 class TreeNode:
@@ -16,8 +21,12 @@ class TreeNode:
         value: The value stored in the node
         left: Reference to the left child node
         right: Reference to the right child node
+        height: Height of the subtree rooted at this node, kept up to date
+            only in balanced trees
     """
     
+    __slots__ = ('value', 'left', 'right', 'height')
+    
     def __init__(self, value: Any) -> None:
         """
         Initialize a tree node with a value.
@@ -28,6 +37,7 @@ class TreeNode:
         self.value: Any = value
         self.left: Optional['TreeNode'] = None
         self.right: Optional['TreeNode'] = None
+        self.height: int = 1
 
 
 class BinarySearchTree:
@@ -38,10 +48,19 @@ class BinarySearchTree:
     finding minimum/maximum values, and performing tree traversals.
     """
     
-    def __init__(self) -> None:
-        """Initialize an empty Binary Search Tree."""
+    def __init__(self, balanced: bool = False) -> None:
+        """
+        Initialize an empty Binary Search Tree.
+        
+        Args:
+            balanced: If True, keep the tree height-balanced (AVL) so that
+                insert, search and delete stay O(log n) for any input order
+        """
         self.root: Optional[TreeNode] = None
         self._size: int = 0
+        self._balanced: bool = balanced
+        # (max_depth, function) from compile_search, reset on every change
+        self._compiled: Optional[Tuple[int, Callable[[Any], bool]]] = None
     
     @property
     def size(self) -> int:
@@ -69,36 +88,161 @@ class BinarySearchTree:
         try:
             if self.root is None:
                 self.root = TreeNode(value)
-                self._size += 1
+                inserted = True
+            elif self._balanced:
+                inserted = self._insert_balanced(value)
             else:
-                self._insert_recursive(self.root, value)
+                inserted = self._insert_node(value)
         except TypeError as e:
             raise TypeError(f"Cannot compare value types: {e}")
+        
+        if inserted:
+            self._size += 1
+            self._compiled = None
     
-    def _insert_recursive(self, node: TreeNode, value: Any) -> None:
+    def _insert_node(self, value: Any) -> bool:
         """
-        Recursively insert a value into the tree.
+        Insert a value into a non-empty tree by walking down from the root.
         
         Args:
-            node: The current node being examined
             value: The value to insert
+            
+        Returns:
+            True if a new node was added, False if the value was already present
         """
-        try:
+        node = self.root
+        while True:
             if value < node.value:
                 if node.left is None:
                     node.left = TreeNode(value)
-                    self._size += 1
-                else:
-                    self._insert_recursive(node.left, value)
+                    return True
+                node = node.left
             elif value > node.value:
                 if node.right is None:
                     node.right = TreeNode(value)
-                    self._size += 1
-                else:
-                    self._insert_recursive(node.right, value)
-            # If value == node.value, do nothing (no duplicates allowed)
-        except TypeError:
-            raise TypeError("Cannot compare values of different incompatible types")
+                    return True
+                node = node.right
+            else:
+                # If value == node.value, do nothing (no duplicates allowed)
+                return False
+    
+    def _insert_balanced(self, value: Any) -> bool:
+        """
+        Insert a value into a non-empty balanced tree and restore its balance.
+        
+        Args:
+            value: The value to insert
+            
+        Returns:
+            True if a new node was added, False if the value was already present
+        """
+        # Remember the descent so the tree can be fixed on the way back up
+        path: List[TreeNode] = []
+        node = self.root
+        while True:
+            path.append(node)
+            if value < node.value:
+                if node.left is None:
+                    node.left = TreeNode(value)
+                    break
+                node = node.left
+            elif value > node.value:
+                if node.right is None:
+                    node.right = TreeNode(value)
+                    break
+                node = node.right
+            else:
+                return False
+        
+        self._rebalance(path)
+        return True
+    
+    @classmethod
+    def from_sorted(cls, values: Iterable[Any],
+                    balanced: bool = False) -> 'BinarySearchTree':
+        """
+        Build a height-balanced tree from a collection of values.
+        
+        The values do not need to be sorted or unique; they are sorted once
+        and duplicates are dropped. Later calls to insert may unbalance the
+        tree again unless balanced is True.
+        
+        Args:
+            values: The values to store in the tree
+            balanced: If True, keep the tree balanced on later changes
+            
+        Returns:
+            A new tree containing the given values
+            
+        Raises:
+            TypeError: If the values are not comparable with each other
+        """
+        bst = cls(balanced)
+        bst.bulk_insert(values)
+        return bst
+    
+    def bulk_insert(self, values: Iterable[Any]) -> None:
+        """
+        Insert many values at once and rebuild the tree balanced.
+        
+        The existing values and the new ones are sorted together and the
+        tree is rebuilt from the midpoints, which is faster than inserting
+        one value at a time and avoids a degenerate tree for sorted input.
+        
+        Args:
+            values: The values to insert into the tree
+            
+        Raises:
+            ValueError: If any of the values is None
+            TypeError: If the values are not comparable with each other
+        """
+        values = list(values)
+        if any(value is None for value in values):
+            raise ValueError("Cannot insert None value into the tree")
+        
+        try:
+            ordered = sorted(self.inorder_traversal() + values)
+        except TypeError as e:
+            raise TypeError(f"Cannot compare value types: {e}")
+        
+        unique: List[Any] = []
+        for value in ordered:
+            if not unique or unique[-1] < value:
+                unique.append(value)
+        
+        self.root = self._build_balanced(unique)
+        self._size = len(unique)
+        self._compiled = None
+    
+    def _build_balanced(self, values: List[Any]) -> Optional[TreeNode]:
+        """
+        Build a balanced subtree from sorted, duplicate-free values.
+        
+        Args:
+            values: The sorted values to build the subtree from
+            
+        Returns:
+            The root of the new subtree, or None if values is empty
+        """
+        root: Optional[TreeNode] = None
+        # Each entry is (low index, high index, parent node, is left child)
+        stack = [(0, len(values) - 1, None, False)] if values else []
+        while stack:
+            low, high, parent, is_left = stack.pop()
+            middle = (low + high) // 2
+            node = TreeNode(values[middle])
+            node.height = (high - low + 1).bit_length()
+            if parent is None:
+                root = node
+            elif is_left:
+                parent.left = node
+            else:
+                parent.right = node
+            if low < middle:
+                stack.append((low, middle - 1, node, True))
+            if middle < high:
+                stack.append((middle + 1, high, node, False))
+        return root
     
     def search(self, value: Any) -> bool:
         """
@@ -121,30 +265,102 @@ class BinarySearchTree:
             return False
         
         try:
-            return self._search_recursive(self.root, value)
+            return self._search_node(value)
         except TypeError as e:
             raise TypeError(f"Cannot compare value types during search: {e}")
     
-    def _search_recursive(self, node: Optional[TreeNode], value: Any) -> bool:
+    def _search_node(self, value: Any) -> bool:
         """
-        Recursively search for a value in the tree.
+        Search for a value by walking down from the root.
         
         Args:
-            node: The current node being examined
             value: The value to search for
-            
+        
         Returns:
             True if the value is found, False otherwise
         """
-        if node is None:
-            return False
+        node = self.root
+        while node is not None:
+            if value == node.value:
+                return True
+            elif value < node.value:
+                node = node.left
+            else:
+                node = node.right
+        return False
+    
+    def compile_search(self, max_depth: int = 8) -> Callable[[Any], bool]:
+        """
+        Generate a search function specialised to the current tree.
         
-        if value == node.value:
-            return True
-        elif value < node.value:
-            return self._search_recursive(node.left, value)
-        else:
-            return self._search_recursive(node.right, value)
+        The top levels of the tree are unrolled into nested if statements
+        with the node values as constants, so a lookup runs straight-line
+        comparisons instead of following node links. Subtrees below
+        max_depth fall back to an ordinary loop. This pays off for trees
+        that are built once and then searched many times. Like search, the
+        generated function raises ValueError when given None.
+        
+        The function is cached until the tree is next modified or a different
+        max_depth is requested. A function obtained before a modification
+        must not be used afterwards: below max_depth it follows live node
+        links, and deletions can change node values, so its results are
+        undefined. Call compile_search again to get a fresh one.
+        
+        Args:
+            max_depth: Number of tree levels to unroll (at most 90); deeper
+                subtrees are searched with a loop
+            
+        Returns:
+            A function that takes a value and returns True if it is in the tree
+            
+        Raises:
+            ValueError: If max_depth is negative or greater than 90
+        """
+        if not 0 <= max_depth <= _MAX_COMPILED_DEPTH:
+            raise ValueError(
+                f"max_depth must be between 0 and {_MAX_COMPILED_DEPTH}, got {max_depth}"
+            )
+        
+        if self._compiled is not None and self._compiled[0] == max_depth:
+            return self._compiled[1]
+        
+        namespace: Dict[str, Any] = {}
+        lines = [
+            "def _descend(node, value):",
+            "    while node is not None:",
+            "        if value == node.value:",
+            "            return True",
+            "        node = node.left if value < node.value else node.right",
+            "    return False",
+            "def search(value):",
+            "    if value is None:",
+            "        raise ValueError('Cannot search for None value')",
+        ]
+        # Each entry is (node, depth, indent level); the left branch is nested
+        # under the 'if' and the right branch follows it at the same level
+        stack = [(self.root, 0, 1)]
+        while stack:
+            node, depth, level = stack.pop()
+            indent = "    " * level
+            if node is None:
+                lines.append(f"{indent}return False")
+            elif depth == max_depth:
+                name = f"s{len(namespace)}"
+                namespace[name] = node
+                lines.append(f"{indent}return _descend({name}, value)")
+            else:
+                name = f"c{len(namespace)}"
+                namespace[name] = node.value
+                lines.append(f"{indent}if value == {name}:")
+                lines.append(f"{indent}    return True")
+                lines.append(f"{indent}if value < {name}:")
+                stack.append((node.right, depth + 1, level))
+                stack.append((node.left, depth + 1, level + 1))
+        
+        exec("\n".join(lines), namespace)
+        search = namespace["search"]
+        self._compiled = (max_depth, search)
+        return search
     
     def delete(self, value: Any) -> bool:
         """
@@ -167,52 +383,179 @@ class BinarySearchTree:
             return False
         
         try:
-            self.root, deleted = self._delete_recursive(self.root, value)
+            deleted = self._delete_node(value)
             if deleted:
                 self._size -= 1
+                self._compiled = None
             return deleted
         except TypeError as e:
             raise TypeError(f"Cannot compare value types during deletion: {e}")
     
-    def _delete_recursive(self, node: Optional[TreeNode], value: Any) -> tuple[Optional[TreeNode], bool]:
+    def _delete_node(self, value: Any) -> bool:
         """
-        Recursively delete a value from the tree.
+        Delete a value by walking down from the root and splicing its node out.
         
         Args:
-            node: The current node being examined
             value: The value to delete
-            
+        
         Returns:
-            A tuple containing the updated node and a boolean indicating if deletion occurred
+            True if the value was found and deleted, False otherwise
         """
+        path: List[TreeNode] = []
+        node = self.root
+        while node is not None:
+            if value < node.value:
+                path.append(node)
+                node = node.left
+            elif value > node.value:
+                path.append(node)
+                node = node.right
+            else:
+                break
+        
         if node is None:
-            return None, False
-        
-        if value < node.value:
-            node.left, deleted = self._delete_recursive(node.left, value)
-            return node, deleted
-        elif value > node.value:
-            node.right, deleted = self._delete_recursive(node.right, value)
-            return node, deleted
+            return False
+        
+        # Node to be deleted found
+        # Case 3: Node has two children
+        if node.left is not None and node.right is not None:
+            # Find the inorder successor (smallest value in right subtree)
+            # and splice it out in the same walk
+            path.append(node)
+            successor = node.right
+            while successor.left is not None:
+                path.append(successor)
+                successor = successor.left
+            node.value = successor.value
+            successor_parent = path[-1]
+            if successor_parent is node:
+                successor_parent.right = successor.right
+            else:
+                successor_parent.left = successor.right
         else:
-            # Node to be deleted found
-            # Case 1: Node has no children (leaf node)
-            if node.left is None and node.right is None:
-                return None, True
+            # Case 1 and 2: Node has at most one child, which takes its place
+            child = node.left if node.left is not None else node.right
+            parent = path[-1] if path else None
+            if parent is None:
+                self.root = child
+            elif parent.left is node:
+                parent.left = child
+            else:
+                parent.right = child
+        
+        if self._balanced:
+            self._rebalance(path)
+        return True
+    
+    def _rebalance(self, path: List[TreeNode]) -> None:
+        """
+        Restore the AVL balance along a root-to-node path after a change.
+        
+        Heights are recomputed bottom-up and any node whose subtrees differ in
+        height by more than one is rotated. The walk stops at the first node
+        whose subtree height is unchanged, since its ancestors are unaffected.
+        
+        Args:
+            path: The nodes from the root down to the parent of the changed link
+        """
+        for index in range(len(path) - 1, -1, -1):
+            node = path[index]
+            old_height = node.height
+            subtree = self._balance(node)
+            if subtree is not node:
+                parent = path[index - 1] if index > 0 else None
+                if parent is None:
+                    self.root = subtree
+                elif parent.left is node:
+                    parent.left = subtree
+                else:
+                    parent.right = subtree
+            if subtree.height == old_height:
+                return
+    
+    def _balance(self, node: TreeNode) -> TreeNode:
+        """
+        Update the height of a node and rotate it if it is out of balance.
+        
+        Args:
+            node: The root of the subtree to balance
+            
+        Returns:
+            The root of the balanced subtree
+        """
+        left_height = node.left.height if node.left is not None else 0
+        right_height = node.right.height if node.right is not None else 0
+        
+        if left_height - right_height > 1:
+            child = node.left
+            if self._height(child.left) < self._height(child.right):
+                node.left = self._rotate_left(child)
+            return self._rotate_right(node)
+        
+        if right_height - left_height > 1:
+            child = node.right
+            if self._height(child.right) < self._height(child.left):
+                node.right = self._rotate_right(child)
+            return self._rotate_left(node)
+        
+        node.height = 1 + max(left_height, right_height)
+        return node
+    
+    def _rotate_left(self, node: TreeNode) -> TreeNode:
+        """
+        Rotate a subtree to the left.
+        
+        Args:
+            node: The root of the subtree, which must have a right child
             
-            # Case 2: Node has one child
-            elif node.left is None:
-                return node.right, True
-            elif node.right is None:
-                return node.left, True
+        Returns:
+            The new root of the subtree (the former right child)
+        """
+        pivot = node.right
+        node.right = pivot.left
+        pivot.left = node
+        self._update_height(node)
+        self._update_height(pivot)
+        return pivot
+    
+    def _rotate_right(self, node: TreeNode) -> TreeNode:
+        """
+        Rotate a subtree to the right.
+        
+        Args:
+            node: The root of the subtree, which must have a left child
             
-            # Case 3: Node has two children
-            else:
-                # Find the inorder successor (smallest value in right subtree)
-                successor_value = self._find_min_value(node.right)
-                node.value = successor_value
-                node.right, _ = self._delete_recursive(node.right, successor_value)
-                return node, True
+        Returns:
+            The new root of the subtree (the former left child)
+        """
+        pivot = node.left
+        node.left = pivot.right
+        pivot.right = node
+        self._update_height(node)
+        self._update_height(pivot)
+        return pivot
+    
+    def _update_height(self, node: TreeNode) -> None:
+        """
+        Recompute the height of a node from its children.
+        
+        Args:
+            node: The node to update
+        """
+        node.height = 1 + max(self._height(node.left), self._height(node.right))
+    
+    @staticmethod
+    def _height(node: Optional[TreeNode]) -> int:
+        """
+        Get the height of a possibly empty subtree.
+        
+        Args:
+            node: The root of the subtree, or None
+            
+        Returns:
+            The height of the subtree (0 for an empty subtree)
+        """
+        return node.height if node is not None else 0
     
     def _find_min_value(self, node: TreeNode) -> Any:
         """
@@ -271,22 +614,74 @@ class BinarySearchTree:
         Returns:
             A list containing all values in the tree in ascending order
         """
-        result: List[Any] = []
-        self._inorder_recursive(self.root, result)
+        # The size is tracked, so the result can be filled in place
+        result: List[Any] = [None] * self._size
+        index = 0
+        stack: List[TreeNode] = []
+        node = self.root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            result[index] = node.value
+            index += 1
+            node = node.right
         return result
     
-    def _inorder_recursive(self, node: Optional[TreeNode], result: List[Any]) -> None:
+    def inorder_morris(self) -> Iterator[Any]:
         """
-        Recursively perform in-order traversal.
+        Iterate over the values in ascending order using O(1) extra memory.
         
-        Args:
-            node: The current node being visited
-            result: The list to append values to
+        This uses Morris traversal: instead of keeping a stack, each node's
+        in-order predecessor temporarily gets a right link back to it, which
+        is removed again on the way through.
+        
+        While the iterator is suspended those links are live in the tree, so
+        the tree must not be used at all until the iterator is exhausted or
+        closed. That includes reads: search, 'in', inorder_traversal,
+        iteration and str may loop forever or fail. Use iter(tree) instead
+        when the loop body needs to look values up in the same tree.
+        
+        Yields:
+            Each value in the tree in ascending order
         """
-        if node is not None:
-            self._inorder_recursive(node.left, result)
-            result.append(node.value)
-            self._inorder_recursive(node.right, result)
+        nodes = self._morris_nodes()
+        try:
+            for node in nodes:
+                yield node.value
+        finally:
+            # Finish the walk if the caller stopped early, so that no
+            # temporary links are left in the tree
+            for _ in nodes:
+                pass
+    
+    def _morris_nodes(self) -> Iterator[TreeNode]:
+        """
+        Walk the tree in order with Morris threading.
+        
+        Yields:
+            Each node in the tree in ascending order of value
+        """
+        current = self.root
+        while current is not None:
+            if current.left is None:
+                yield current
+                current = current.right
+                continue
+            
+            predecessor = current.left
+            while predecessor.right is not None and predecessor.right is not current:
+                predecessor = predecessor.right
+            
+            if predecessor.right is None:
+                # Link back so the walk can return here after the left subtree
+                predecessor.right = current
+                current = current.left
+            else:
+                predecessor.right = None
+                yield current
+                current = current.right
     
     def __str__(self) -> str:
         """
@@ -307,6 +702,62 @@ class BinarySearchTree:
             Detailed string representation of the BST
         """
         return f"BinarySearchTree(size={self.size}, values={self.inorder_traversal()})"
+    
+    def __len__(self) -> int:
+        """
+        Return the number of nodes in the tree.
+        
+        Returns:
+            The number of nodes in the tree
+        """
+        return self._size
+    
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Iterate over the values in the tree in ascending order.
+        
+        Values are produced lazily with an explicit stack, so only the path
+        to the current node is kept in memory.
+        
+        Yields:
+            Each value in the tree in ascending order
+        """
+        stack: List[TreeNode] = []
+        node = self.root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.value
+            node = node.right
+    
+    def __contains__(self, value: Any) -> bool:
+        """
+        Check whether a value is in the tree with the 'in' operator.
+        
+        Args:
+            value: The value to search for
+            
+        Returns:
+            True if the value is found, False otherwise (including for values
+            that cannot be compared with the tree's values)
+        """
+        try:
+            return self.search(value)
+        except (TypeError, ValueError):
+            return False
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Return the state to pickle, leaving out the generated search function.
+        
+        Returns:
+            A copy of the instance attributes
+        """
+        state = self.__dict__.copy()
+        state['_compiled'] = None
+        return state
 
 
 if __name__ == "__main__":